@@ -0,0 +1,140 @@
+import os
+import threading
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import router
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+CACHE_ALIAS = 'auth_tokens'
+
+
+class TokenCache:
+    """
+    Token key -> snapshot of the token and its user, kept in a Django cache.
+
+    Size and TTL come from the cache alias configuration. Each hit rebuilds
+    fresh model instances, so concurrent requests never share a user object.
+    A hit costs one cache get (a dict lookup plus unpickle for local memory,
+    a round trip for Redis) and two Model.from_db calls, with no query.
+
+    Hit and miss counters are kept per process, even when the entries live
+    in a shared backend; stats() labels them accordingly.
+    """
+
+    def __init__(self, alias=CACHE_ALIAS):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key):
+        entry = self.cache.get(f'token:{key}')
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return self._rebuild(entry)
+
+    def set(self, key, credentials):
+        user, token = credentials
+        entry = {
+            'user': [getattr(user, f.attname) for f in user._meta.concrete_fields],
+            'token': [getattr(token, f.attname) for f in token._meta.concrete_fields],
+        }
+        self.cache.set(f'token:{key}', entry)
+        # Reverse index so every token of a user can be dropped on deactivation
+        user_keys = self.cache.get(f'user:{user.pk}', set())
+        self.cache.set(f'user:{user.pk}', user_keys | {key})
+
+    def evict(self, key):
+        self.cache.delete(f'token:{key}')
+
+    def evict_user(self, user_id):
+        user_keys = self.cache.get(f'user:{user_id}', set())
+        self.cache.delete_many([f'token:{key}' for key in user_keys] + [f'user:{user_id}'])
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.cache.__class__.__name__,
+                "ttl": self.cache.default_timeout,
+                # Counters below cover only the worker that served this request
+                "counters_scope": "process",
+                "pid": os.getpid(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _rebuild(self, entry):
+        User = get_user_model()
+        user = User.from_db(
+            router.db_for_read(User),
+            [f.attname for f in User._meta.concrete_fields],
+            entry['user'],
+        )
+        token = Token.from_db(
+            router.db_for_read(Token),
+            [f.attname for f in Token._meta.concrete_fields],
+            entry['token'],
+        )
+        token.user = user
+        return (user, token)
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that serves repeat lookups from token_cache.
+
+    Entries are evicted when the token is deleted or rotated and when the
+    user is saved. With a shared cache backend that reaches every worker
+    process. QuerySet.update() skips those signals, so bulk deactivation
+    should go through deactivate_users().
+    """
+
+    def authenticate_credentials(self, key):
+        credentials = token_cache.get(key)
+        if credentials is not None:
+            return credentials
+
+        credentials = super().authenticate_credentials(key)
+        token_cache.set(key, credentials)
+        return credentials
+
+
+def deactivate_users(queryset):
+    """Bulk-deactivate users and drop their cached tokens."""
+    user_ids = list(queryset.values_list('pk', flat=True))
+    count = queryset.update(is_active=False)
+    for user_id in user_ids:
+        token_cache.evict_user(user_id)
+    return count
+
+
+@receiver(post_delete, sender=Token)
+@receiver(post_save, sender=Token)
+def evict_token(sender, instance, **kwargs):
+    token_cache.evict(instance.key)
+
+
+@receiver(post_save, sender=get_user_model())
+def evict_user_tokens(sender, instance, **kwargs):
+    token_cache.evict_user(instance.pk)
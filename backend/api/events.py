@@ -0,0 +1,108 @@
+import json
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+from rest_framework.renderers import BaseRenderer
+
+
+class InProcessBroker:
+    """Fans published events out to every subscriber queue in this process."""
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        q = queue.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            self._subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def publish(self, event, data):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for q in subscribers:
+            try:
+                q.put_nowait((event, data))
+            except queue.Full:
+                # Slow client; drop the event rather than block the publisher
+                pass
+
+
+class NullBroker:
+    """Stand-in that accepts subscriptions but never delivers anything."""
+
+    def subscribe(self):
+        return queue.Queue()
+
+    def unsubscribe(self, q):
+        pass
+
+    def publish(self, event, data):
+        pass
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                path = getattr(settings, 'EVENT_BROKER', 'api.events.InProcessBroker')
+                _broker = import_string(path)()
+    return _broker
+
+
+def set_broker(broker):
+    global _broker
+    _broker = broker
+
+
+def publish(event, data):
+    get_broker().publish(event, data)
+
+
+def format_sse(event, data):
+    payload = json.dumps(data, cls=DjangoJSONEncoder)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def event_stream(heartbeat, max_age):
+    # Each open stream holds a worker thread, so end it after max_age seconds;
+    # EventSource and the desktop client reconnect on their own
+    broker = get_broker()
+    # Subscribing here rather than in the view means a response closed before
+    # its first chunk never leaves a queue behind in the broker
+    q = broker.subscribe()
+    deadline = time.monotonic() + max_age
+    try:
+        yield "retry: 3000\n\n"
+        while time.monotonic() < deadline:
+            try:
+                event, data = q.get(timeout=heartbeat)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(event, data)
+    finally:
+        broker.unsubscribe(q)
+
+
+class EventStreamRenderer(BaseRenderer):
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
@@ -0,0 +1,125 @@
+import io
+import threading
+import warnings
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+ENGINES = ('auto', 'pyarrow', 'c', 'python')
+
+# warnings.catch_warnings() swaps process-global state, so concurrent C-engine
+# parses on threaded workers must not overlap
+_c_parser_lock = threading.Lock()
+
+
+def get_engine():
+    engine = getattr(settings, 'CSV_PARSE_ENGINE', 'auto')
+    if engine not in ENGINES:
+        raise ImproperlyConfigured(
+            f"CSV_PARSE_ENGINE must be one of {', '.join(ENGINES)}, got {engine!r}"
+        )
+    if engine == 'auto':
+        try:
+            import pyarrow.csv  # noqa: F401
+            return 'pyarrow'
+        except ImportError:
+            return 'c'
+    return engine
+
+
+def read_csv(file, engine=None):
+    """
+    Parse an uploaded CSV, skipping malformed rows instead of failing.
+
+    Returns (dataframe, skipped_row_count).
+    """
+    engine = engine or get_engine()
+    if engine == 'pyarrow':
+        return _read_pyarrow(file)
+    if engine == 'python':
+        return _read_python(file)
+    return _read_c(file)
+
+
+def _read_pyarrow(file):
+    # Multi-threaded reader; block parsing is spread over every core
+    import pyarrow as pa
+    from pyarrow import csv
+
+    skipped = []
+
+    def handle_invalid(row):
+        skipped.append(row.number)
+        return 'skip'
+
+    # pyarrow infers dates, times and timestamps, which the pandas engines
+    # leave as the original text. Types are inferred from the first block, so
+    # read just that block to find those columns and keep them as strings.
+    reader = csv.open_csv(file, parse_options=csv.ParseOptions(invalid_row_handler=lambda row: 'skip'))
+    text_columns = {f.name: pa.string() for f in reader.schema if pa.types.is_temporal(f.type)}
+    reader.close()
+    file.seek(0)
+
+    table = csv.read_csv(
+        file,
+        read_options=csv.ReadOptions(use_threads=True),
+        parse_options=csv.ParseOptions(invalid_row_handler=handle_invalid),
+        # Empty cells in columns read as strings (e.g. numbers mixed with typos)
+        # must come back as nulls, as they do with the pandas engines
+        convert_options=csv.ConvertOptions(strings_can_be_null=True, column_types=text_columns),
+    )
+    return table.to_pandas(), len(skipped)
+
+
+def _read_python(file):
+    import pandas as pd
+
+    skipped = []
+
+    def handle_bad_line(line):
+        skipped.append(line)
+        return None
+
+    # The python engine needs text, but uploads are binary file objects
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    try:
+        df = pd.read_csv(text, engine='python', on_bad_lines=handle_bad_line)
+    finally:
+        text.detach()
+    return df, len(skipped)
+
+
+def _read_c(file):
+    import pandas as pd
+
+    # The C parser only reports skipped lines through ParserWarning messages
+    with _c_parser_lock, warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', pd.errors.ParserWarning)
+        df = pd.read_csv(file, engine='c', on_bad_lines='warn')
+    skipped = sum(
+        str(w.message).count('Skipping line')
+        for w in caught
+        if issubclass(w.category, pd.errors.ParserWarning)
+    )
+    return df, skipped
+
+
+def coerce_numeric(df, columns):
+    """
+    Convert the given columns to numbers in place.
+
+    Returns {column: {"null": n, "invalid": m}} for every column in df, where
+    "invalid" counts non-empty values that could not be read as numbers.
+    """
+    import pandas as pd
+
+    stats = {}
+    for col in df.columns:
+        nulls = df[col].isna()
+        invalid = 0
+        if col in columns:
+            numeric = pd.to_numeric(df[col], errors='coerce')
+            invalid = int((numeric.isna() & ~nulls).sum())
+            df[col] = numeric
+        stats[str(col)] = {"null": int(nulls.sum()), "invalid": invalid}
+    return stats
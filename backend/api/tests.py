@@ -0,0 +1,212 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework import exceptions
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from . import events, parsing
+from .authentication import CachedTokenAuthentication, deactivate_users, token_cache
+
+DIRTY_CSV = (
+    b"Type,Flowrate,Pressure,Temperature\n"
+    b"Pump,10,5,50\n"
+    b"Valve,,6,abc\n"
+    b"Pump,12,7,60,extra\n"
+    b"Tank,20,8,70\n"
+    b"Valve,oops,x,90\n"
+)
+
+
+class EventBrokerTests(TestCase):
+    def tearDown(self):
+        events.set_broker(None)
+
+    def test_publish_fans_out_to_every_subscriber(self):
+        broker = events.InProcessBroker()
+        first, second = broker.subscribe(), broker.subscribe()
+        broker.publish('summary', {'id': 1})
+        self.assertEqual(first.get_nowait(), ('summary', {'id': 1}))
+        self.assertEqual(second.get_nowait(), ('summary', {'id': 1}))
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        broker = events.InProcessBroker(max_queue_size=1)
+        q = broker.subscribe()
+        broker.publish('summary', {'id': 1})
+        broker.publish('summary', {'id': 2})
+        self.assertEqual(q.qsize(), 1)
+        self.assertEqual(q.get_nowait(), ('summary', {'id': 1}))
+
+    @override_settings(EVENT_BROKER='api.events.NullBroker')
+    def test_broker_is_chosen_by_setting(self):
+        events.set_broker(None)
+        self.assertIsInstance(events.get_broker(), events.NullBroker)
+
+    def test_set_broker_swaps_in_null_broker(self):
+        events.set_broker(events.NullBroker())
+        q = events.get_broker().subscribe()
+        events.publish('summary', {'id': 1})
+        self.assertTrue(q.empty())
+
+    def test_upload_and_clear_publish_events(self):
+        broker = events.InProcessBroker()
+        events.set_broker(broker)
+        q = broker.subscribe()
+        client = APIClient()
+
+        upload = SimpleUploadedFile('plant.csv', DIRTY_CSV, content_type='text/csv')
+        response = client.post('/api/upload/', {'file': upload})
+        event, data = q.get_nowait()
+        self.assertEqual(event, 'summary')
+        self.assertEqual(data['id'], response.data['summary']['id'])
+
+        client.post('/api/clear/')
+        self.assertEqual(q.get_nowait(), ('clear', {}))
+
+
+@override_settings(EVENT_STREAM_HEARTBEAT=0.05, EVENT_STREAM_MAX_AGE=0.3)
+class StreamViewTests(TestCase):
+    def setUp(self):
+        self.broker = events.InProcessBroker()
+        events.set_broker(self.broker)
+
+    def tearDown(self):
+        events.set_broker(None)
+
+    def test_stream_frames_events_and_unsubscribes_at_max_age(self):
+        response = APIClient().get('/api/stream/')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunks = iter(response.streaming_content)
+        self.assertEqual(next(chunks), b'retry: 3000\n\n')
+
+        self.broker.publish('summary', {'id': 7})
+        self.assertEqual(next(chunks), b'event: summary\ndata: {"id": 7}\n\n')
+
+        rest = b''.join(chunks)
+        self.assertIn(b': keepalive\n\n', rest)
+        self.assertEqual(len(self.broker._subscribers), 0)
+
+    def test_unstarted_stream_leaves_no_subscriber(self):
+        response = APIClient().get('/api/stream/')
+        response.close()
+        self.assertEqual(len(self.broker._subscribers), 0)
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        caches['auth_tokens'].clear()
+        token_cache.reset_stats()
+        self.user = User.objects.create_user('operator', password='secret')
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def test_hit_skips_database_and_returns_fresh_user(self):
+        first, _ = self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            second, token = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual(second.pk, self.user.pk)
+        self.assertIsNot(first, second)
+        self.assertEqual(token.key, self.token.key)
+        self.assertEqual(token_cache.stats()["hits"], 1)
+        self.assertEqual(token_cache.stats()["misses"], 1)
+        self.assertEqual(token_cache.stats()["counters_scope"], "process")
+
+    def test_entry_expires_after_ttl(self):
+        self.auth.authenticate_credentials(self.token.key)
+        ttl = caches['auth_tokens'].default_timeout
+        with mock.patch('time.time', return_value=time.time() + ttl + 1):
+            with self.assertNumQueries(1):
+                self.auth.authenticate_credentials(self.token.key)
+
+    def test_deleted_token_is_evicted(self):
+        key = self.token.key
+        self.auth.authenticate_credentials(key)
+        self.token.delete()
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(key)
+
+    def test_deactivated_user_is_evicted(self):
+        self.auth.authenticate_credentials(self.token.key)
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_bulk_deactivation_is_evicted(self):
+        self.auth.authenticate_credentials(self.token.key)
+        deactivate_users(User.objects.filter(pk=self.user.pk))
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+
+class LoginViewTests(TestCase):
+    def setUp(self):
+        caches['auth_tokens'].clear()
+        User.objects.create_user('operator', password='secret')
+        self.client = APIClient()
+
+    def test_wrong_password_rejected_even_with_valid_token(self):
+        response = self.client.post('/api/login/', {'username': 'operator', 'password': 'secret'})
+        self.assertEqual(response.status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + response.data['token'])
+
+        response = self.client.post('/api/login/', {'username': 'operator', 'password': 'WRONG'})
+        self.assertEqual(response.status_code, 400)
+
+
+class CsvParsingTests(TestCase):
+    def upload(self):
+        return SimpleUploadedFile('plant.csv', DIRTY_CSV, content_type='text/csv')
+
+    def test_every_engine_skips_bad_rows_and_counts_invalid_values(self):
+        for engine in ('pyarrow', 'c', 'python'):
+            with self.subTest(engine=engine):
+                df, skipped = parsing.read_csv(self.upload(), engine=engine)
+                self.assertEqual(skipped, 1)
+                self.assertEqual(len(df), 4)
+
+                stats = parsing.coerce_numeric(df, ['Flowrate', 'Pressure', 'Temperature'])
+                self.assertEqual(stats['Flowrate'], {"null": 1, "invalid": 1})
+                self.assertEqual(stats['Pressure'], {"null": 0, "invalid": 1})
+                self.assertEqual(stats['Temperature'], {"null": 0, "invalid": 1})
+                self.assertEqual(stats['Type'], {"null": 0, "invalid": 0})
+                self.assertEqual(df['Flowrate'].sum(), 30)
+
+    def test_engines_return_identical_preview_for_sample_file(self):
+        sample = (settings.BASE_DIR.parent / 'sample_equipment_data.csv').read_bytes()
+        results = {}
+        for engine in ('pyarrow', 'c', 'python'):
+            with override_settings(CSV_PARSE_ENGINE=engine):
+                upload = SimpleUploadedFile('sample.csv', sample, content_type='text/csv')
+                response = APIClient().post('/api/upload/', {'file': upload})
+            self.assertEqual(response.status_code, 201)
+            results[engine] = (response.data['data'], response.data['column_stats'])
+
+        self.assertEqual(results['c'][0][0]['Timestamp'], '2023-10-01 08:00:00')
+        self.assertEqual(results['pyarrow'], results['c'])
+        self.assertEqual(results['python'], results['c'])
+
+    def test_c_engine_counts_stay_separate_across_threads(self):
+        def parse(bad_rows):
+            body = b"a,b\n" + b"1,2\n" * 50 + b"1,2,3\n" * bad_rows
+            upload = SimpleUploadedFile('plant.csv', body, content_type='text/csv')
+            return parsing.read_csv(upload, engine='c')[1]
+
+        expected = [n % 5 for n in range(40)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertEqual(list(pool.map(parse, expected)), expected)
+
+    def test_upload_reports_skipped_rows_and_column_stats(self):
+        for engine in ('pyarrow', 'c', 'python'):
+            with self.subTest(engine=engine), override_settings(CSV_PARSE_ENGINE=engine):
+                response = APIClient().post('/api/upload/', {'file': self.upload()})
+                self.assertEqual(response.status_code, 201)
+                self.assertEqual(response.data['skipped_rows'], 1)
+                self.assertEqual(response.data['column_stats']['Flowrate'], {"null": 1, "invalid": 1})
+                self.assertEqual(response.data['summary']['avg_flowrate'], 15)
@@ -1,11 +1,13 @@
 from django.urls import path
-from .views import UploadView, SummaryView, HistoryView, LoginView, ReportView, ClearHistoryView
+from .views import UploadView, SummaryView, HistoryView, LoginView, ReportView, ClearHistoryView, StreamView, AuthCacheStatsView
 
 urlpatterns = [
     path('upload/', UploadView.as_view()),
     path('summary/', SummaryView.as_view()),
     path('history/', HistoryView.as_view()),
     path('login/', LoginView.as_view()),
+    path('auth/cache/', AuthCacheStatsView.as_view()),
     path('report/', ReportView.as_view()),
     path('clear/', ClearHistoryView.as_view()),
+    path('stream/', StreamView.as_view()),
 ]
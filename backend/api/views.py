@@ -1,12 +1,14 @@
-import pandas as pd
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAdminUser
 from django.utils import timezone
 from .models import EquipmentData
 from .serializers import EquipmentDataSerializer
-from django.http import HttpResponse
-from reportlab.pdfgen import canvas
+from django.http import HttpResponse, StreamingHttpResponse
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from . import events, parsing
 import io
 import json
 
@@ -16,8 +18,11 @@ class UploadView(APIView):
         if not file:
             return Response({"error": "No file uploaded"}, status=status.HTTP_400_BAD_REQUEST)
 
+        # Heavy imports are deferred so worker boot and manage.py stay fast
+        import pandas as pd
+
         try:
-            df = pd.read_csv(file)
+            df, skipped_rows = parsing.read_csv(file)
 
             def get_col(df, candidates):
                 for col in df.columns:
@@ -28,11 +33,18 @@ class UploadView(APIView):
             flow_col = get_col(df, ['Flowrate', 'Flow Rate', 'Flow_Rate'])
             press_col = get_col(df, ['Pressure'])
             temp_col = get_col(df, ['Temperature', 'Temp'])
+
+            # Dirty values become NaN and are reported instead of breaking the averages
+            column_stats = parsing.coerce_numeric(df, [c for c in (flow_col, press_col, temp_col) if c])
+
+            def col_mean(col):
+                value = df[col].mean() if col else 0
+                return 0 if pd.isna(value) else value
             
             total_count = len(df)
-            avg_flow = df[flow_col].mean() if flow_col else 0
-            avg_pressure = df[press_col].mean() if press_col else 0
-            avg_temp = df[temp_col].mean() if temp_col else 0
+            avg_flow = col_mean(flow_col)
+            avg_pressure = col_mean(press_col)
+            avg_temp = col_mean(temp_col)
 
             dist_col = get_col(df, ['Type', 'EquipmentType']) or get_col(df, ['Status'])
             
@@ -55,12 +67,15 @@ class UploadView(APIView):
             EquipmentData.objects.exclude(id__in=ids_to_keep).delete()
 
             serializer = EquipmentDataSerializer(data_entry)
+            events.publish('summary', serializer.data)
 
             preview_data = df.head(500).fillna(0).to_dict(orient='records')
 
             return Response({
                 "summary": serializer.data,
-                "data": preview_data
+                "data": preview_data,
+                "skipped_rows": skipped_rows,
+                "column_stats": column_stats
             }, status=status.HTTP_201_CREATED)
 
         except Exception as e:
@@ -86,18 +101,35 @@ class LoginView(APIView):
     def post(self, request):
         from django.contrib.auth import authenticate
         from rest_framework.authtoken.models import Token
+        from .authentication import token_cache
         
         username = request.data.get('username')
         password = request.data.get('password')
         
         user = authenticate(username=username, password=password)
         if user:
-            token, _ = Token.objects.get_or_create(user=user)
+            # A client re-logging in with its still-valid token can reuse it
+            # without another token query
+            if isinstance(request.auth, Token) and request.auth.user_id == user.pk:
+                token = request.auth
+            else:
+                token, _ = Token.objects.get_or_create(user=user)
+            token_cache.set(token.key, (user, token))
             return Response({"token": token.key, "user": username})
         return Response({"error": "Invalid credentials"}, status=status.HTTP_400_BAD_REQUEST)
 
+class AuthCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        from .authentication import token_cache
+
+        return Response(token_cache.stats())
+
 class ReportView(APIView):
     def get(self, request):
+        from reportlab.pdfgen import canvas
+
         buffer = io.BytesIO()
         p = canvas.Canvas(buffer)
         
@@ -149,4 +181,19 @@ class ReportView(APIView):
 class ClearHistoryView(APIView):
     def post(self, request):
         EquipmentData.objects.all().delete()
+        events.publish('clear', {})
         return Response({"message": "History cleared"}, status=status.HTTP_200_OK)
+
+class StreamView(APIView):
+    renderer_classes = [events.EventStreamRenderer, JSONRenderer]
+
+    def get(self, request):
+        heartbeat = getattr(settings, 'EVENT_STREAM_HEARTBEAT', 15)
+        max_age = getattr(settings, 'EVENT_STREAM_MAX_AGE', 300)
+        response = StreamingHttpResponse(
+            events.event_stream(heartbeat, max_age),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
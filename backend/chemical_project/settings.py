@@ -70,13 +70,49 @@ DATABASES = {
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'api.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
 }
 
+# Live update stream (/api/stream/). Streams are long-lived, so gunicorn runs
+# threaded workers (see gunicorn.conf.py). The in-process broker only reaches
+# clients connected to the same worker process; swap in api.events.NullBroker
+# to disable delivery.
+EVENT_BROKER = os.environ.get('EVENT_BROKER', 'api.events.InProcessBroker')
+EVENT_STREAM_HEARTBEAT = 15
+EVENT_STREAM_MAX_AGE = 300
+
+# CSV parser used by /api/upload/: 'auto' (pyarrow if installed, else 'c'),
+# 'pyarrow' (multi-threaded), 'c' or 'python'
+CSV_PARSE_ENGINE = os.environ.get('CSV_PARSE_ENGINE', 'auto')
+
+# 'auth_tokens' backs CachedTokenAuthentication (TIMEOUT is the TTL in seconds).
+# Local memory is only shared within one process; with more than one worker
+# process set REDIS_URL (needs the redis package) so token evictions reach
+# every worker.
+REDIS_URL = os.environ.get('REDIS_URL')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'auth_tokens': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'auth-tokens',
+        'TIMEOUT': 60,
+        'OPTIONS': {'MAX_ENTRIES': 1024},
+    },
+}
+if REDIS_URL:
+    CACHES['auth_tokens'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'auth-tokens',
+        'TIMEOUT': 60,
+    }
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = 'en-us'
@@ -0,0 +1,14 @@
+# Picked up automatically by `gunicorn chemical_project.wsgi:application` when
+# run from this directory.
+import os
+
+# /api/stream/ keeps a request open indefinitely. Sync workers would block the
+# whole API behind one client and get killed by the worker timeout, so each
+# connection gets its own thread instead.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 32))
+
+# A single process keeps every client on the same in-process event broker.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '8000')
@@ -0,0 +1,133 @@
+"""
+Startup profile for the backend and desktop entry points.
+
+Each target runs in a fresh interpreter twice: once as the tree stands and
+once with the heavy modules imported eagerly, which is what startup cost
+before they were deferred. The report lists the slowest top-level imports
+(via ``-X importtime``) and then compares wall times against that baseline.
+
+    python benchmark_imports.py [--top 15] [--repeat 3]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+BACKEND_EAGER = "import pandas, reportlab.pdfgen.canvas; "
+DESKTOP_EAGER = (
+    "import pandas, numpy, matplotlib.backends.backend_qt5agg, matplotlib.figure; "
+)
+
+# Builds and shows MainWindow offscreen, then exits straight away. The error
+# dialog is silenced because no backend is expected to be running.
+SHOW_WINDOW = (
+    "import os, sys; from PyQt5.QtWidgets import QApplication; import main; "
+    "main.QMessageBox.critical = lambda *args: None; "
+    "app = QApplication(sys.argv); window = main.MainWindow(); window.show(); "
+    "app.processEvents(); sys.stdout.flush(); os._exit(0)"
+)
+
+TARGETS = [
+    (
+        "backend (worker boot)",
+        ROOT / "backend",
+        "import django; django.setup(); import api.urls",
+        BACKEND_EAGER,
+        {"DJANGO_SETTINGS_MODULE": "chemical_project.settings"},
+    ),
+    (
+        "desktop (import main)",
+        ROOT / "desktop",
+        "import main",
+        DESKTOP_EAGER,
+        {},
+    ),
+    (
+        "desktop (time to first window)",
+        ROOT / "desktop",
+        SHOW_WINDOW,
+        DESKTOP_EAGER,
+        {"QT_QPA_PLATFORM": "offscreen"},
+    ),
+]
+
+
+def parse_importtime(stderr):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        # Only top-level imports; nested ones are indented under their parent
+        if name.startswith("  "):
+            continue
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run(cwd, code, extra_env, importtime=False):
+    env = dict(os.environ, **extra_env)
+    args = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    start = time.perf_counter()
+    result = subprocess.run(args, cwd=cwd, env=env, capture_output=True, text=True)
+    return result, time.perf_counter() - start
+
+
+def wall_time(cwd, code, extra_env, repeat):
+    """Best of ``repeat`` runs in ms, or None if the target fails."""
+    best = None
+    for _ in range(repeat):
+        result, elapsed = run(cwd, code, extra_env)
+        if result.returncode != 0:
+            return None
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def profile(label, cwd, code, extra_env, top):
+    print(f"== {label} ==")
+    result, _ = run(cwd, code, extra_env, importtime=True)
+    if result.returncode != 0:
+        print(f"  failed: {result.stderr.strip().splitlines()[-1]}")
+        print()
+        return False
+
+    rows = sorted(parse_importtime(result.stderr), key=lambda r: r[2], reverse=True)
+    total_ms = sum(r[2] for r in rows) / 1000
+    print(f"  import time: {total_ms:.1f} ms")
+    print(f"  {'cumulative ms':>14}  {'self ms':>8}  module")
+    for name, self_us, cumulative_us in rows[:top]:
+        print(f"  {cumulative_us / 1000:>14.1f}  {self_us / 1000:>8.1f}  {name}")
+    print()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="number of imports to list per target")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per wall-time measurement (best is kept)")
+    args = parser.parse_args()
+
+    comparisons = []
+    for label, cwd, code, eager, extra_env in TARGETS:
+        if not profile(label, cwd, code, extra_env, args.top):
+            continue
+        current = wall_time(cwd, code, extra_env, args.repeat)
+        baseline = wall_time(cwd, eager + code, extra_env, args.repeat)
+        comparisons.append((label, current, baseline))
+
+    print("== wall time vs eager imports ==")
+    print(f"  {'lazy ms':>9}  {'eager ms':>9}  {'saved ms':>9}  target")
+    for label, current, baseline in comparisons:
+        if current is None or baseline is None:
+            print(f"  {'-':>9}  {'-':>9}  {'-':>9}  {label} (failed)")
+            continue
+        print(f"  {current:>9.1f}  {baseline:>9.1f}  {baseline - current:>9.1f}  {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,13 @@
 import sys
+import json
+import threading
 import requests
-import pandas as pd
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QHBoxLayout, QPushButton, QLabel, QFileDialog,
     QTableWidget, QTableWidgetItem, QTabWidget, QMessageBox, QHeaderView
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
 
 API_URL = "http://127.0.0.1:8000/api"
 
@@ -60,6 +58,62 @@ class ReportWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+class PrewarmWorker(QThread):
+    def run(self):
+        # Pull in the plotting and data stack off the UI thread; the canvas is
+        # built once this finishes, so the window never blocks on these imports
+        try:
+            import matplotlib.backends.backend_qt5agg  # noqa: F401
+            import matplotlib.figure  # noqa: F401
+            import pandas  # noqa: F401
+        except Exception:
+            pass
+
+class EventStreamWorker(QObject):
+    event = pyqtSignal(str, object)
+
+    def __init__(self):
+        super().__init__()
+        self.stopped = threading.Event()
+        self.connected = False
+        # A blocking socket read cannot be interrupted portably, so the stream is
+        # read on a daemon thread instead of a QThread: Qt never owns it, and a
+        # read still pending at exit cannot abort the app
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                with requests.get(f"{API_URL}/stream/", stream=True, timeout=(3, 60),
+                                  headers={"Accept": "text/event-stream"}) as response:
+                    # Resync on reconnect so nothing published while offline is missed
+                    if self.connected:
+                        self.event.emit("reconnect", {})
+                    self.connected = True
+                    event_name, data_lines = "message", []
+                    # chunk_size=1: the default 512-byte buffer would hold small events back
+                    for line in response.iter_lines(chunk_size=1, decode_unicode=True):
+                        if self.stopped.is_set():
+                            return
+                        if not line:
+                            if data_lines:
+                                self.event.emit(event_name, json.loads("\n".join(data_lines)))
+                            event_name, data_lines = "message", []
+                        elif line.startswith("event:"):
+                            event_name = line[6:].strip()
+                        elif line.startswith("data:"):
+                            data_lines.append(line[5:].strip())
+            except Exception:
+                pass
+            # Back off before reconnecting; stop() cuts the wait short
+            self.stopped.wait(3)
+
+    def stop(self):
+        self.stopped.set()
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -69,6 +123,7 @@ class MainWindow(QMainWindow):
         self.upload_worker = None
         self.history_worker = None
         self.report_worker = None
+        self.history = []
         
         self.pie_ax = None
         self.annot = None
@@ -105,6 +160,32 @@ class MainWindow(QMainWindow):
 
         self.load_history()
 
+        self.stream_worker = EventStreamWorker()
+        self.stream_worker.event.connect(self.handle_event)
+        self.stream_worker.start()
+
+        # Start warming imports once the event loop is running, i.e. after the window is shown
+        self.prewarm_worker = PrewarmWorker()
+        self.prewarm_worker.finished.connect(self.init_canvas)
+        QTimer.singleShot(0, self.prewarm_worker.start)
+
+    def handle_event(self, name, data):
+        if name == "reconnect":
+            self.load_history()
+        elif name == "summary":
+            self.add_to_history(data)
+        elif name == "clear":
+            self.update_history([])
+
+    def add_to_history(self, entry):
+        history = [h for h in self.history if h.get("id") != entry.get("id")]
+        self.update_history([entry] + history[:4])
+
+    def closeEvent(self, event):
+        self.stream_worker.stop()
+        self.prewarm_worker.wait()
+        super().closeEvent(event)
+
     def setup_dashboard(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(5, 5, 5, 5)
@@ -148,12 +229,29 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(stats)
 
+        self.figure = None
+        self.canvas = None
+        self.canvas_placeholder = QLabel("Loading charts...")
+        self.canvas_placeholder.setAlignment(Qt.AlignCenter)
+        self.canvas_placeholder.setStyleSheet("background:#1e293b; border-radius:6px; color:#94a3b8;")
+        layout.addWidget(self.canvas_placeholder, 1)
+
+        self.dashboard_layout = layout
+        self.dashboard_tab.setLayout(layout)
+
+    def init_canvas(self):
+        if self.canvas is not None:
+            return
+
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
         self.figure = Figure(facecolor="#1e293b", constrained_layout=True)
         self.figure.set_constrained_layout_pads(w_pad=0.02, h_pad=0.02, wspace=0.05, hspace=0.05)
         self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
-
-        self.dashboard_tab.setLayout(layout)
+        self.dashboard_layout.replaceWidget(self.canvas_placeholder, self.canvas)
+        self.canvas_placeholder.deleteLater()
+        self.canvas_placeholder = None
 
         self.canvas.draw()
 
@@ -191,10 +289,10 @@ class MainWindow(QMainWindow):
 
     def upload_success(self, data):
         self.update_dashboard(data)
+        self.add_to_history(data.get("summary", {}))
         QMessageBox.information(self, "Success", "File uploaded successfully!")
         self.upload_btn.setEnabled(True)
         self.tabs.setEnabled(True)
-        self.load_history()
 
     def upload_error(self, msg):
         self.upload_btn.setDisabled(False)
@@ -233,12 +331,16 @@ class MainWindow(QMainWindow):
         self.stats["Avg Pressure"].setText(f"Avg Pressure\n{summary.get('avg_pressure', 0):.2f}")
         self.stats["Avg Temp"].setText(f"Avg Temp\n{summary.get('avg_temperature', 0):.2f}")
 
+        self.init_canvas()
         self.figure.clear()
         
         if not rows:
             self.canvas.draw()
             return
 
+        import numpy as np
+        import pandas as pd
+
         df = pd.DataFrame(rows)
 
         def get_col(df, candidates):
@@ -312,7 +414,6 @@ class MainWindow(QMainWindow):
             type_map = {t: i for i, t in enumerate(types)}
             x_vals = df[type_col].map(type_map)
             
-            import numpy as np
             jitter = np.random.uniform(-0.15, 0.15, size=len(x_vals))
             
             ax4.scatter(x_vals + jitter, df[temp_col], color='#f59e0b', alpha=0.6, s=40)
@@ -370,9 +471,7 @@ class MainWindow(QMainWindow):
 
 
     def update_history(self, history):
-        if not history:
-            return
-        
+        self.history = history
         self.table.setRowCount(len(history))
         for i, row in enumerate(history):
             items = [
@@ -38,8 +38,25 @@ function App() {
     const [loading, setLoading] = useState(false);
     const fileInputRef = useRef(null);
 
+    const addToHistory = (entry) => {
+        setHistory(prev => [entry, ...prev.filter(h => h.id !== entry.id)].slice(0, 5));
+    };
+
     useEffect(() => {
         fetchHistory();
+
+        // Live updates pushed by the backend; resync history on every reconnect
+        const source = new EventSource(`${axios.defaults.baseURL}/api/stream/`);
+        let connected = false;
+        source.onopen = () => {
+            if (connected) fetchHistory();
+            connected = true;
+        };
+        source.addEventListener('summary', (e) => addToHistory(JSON.parse(e.data)));
+        source.addEventListener('clear', () => {
+            setHistory([]);
+        });
+        return () => source.close();
     }, []);
 
     const fetchHistory = async () => {
@@ -90,7 +107,7 @@ function App() {
             const res = await axios.post('/api/upload/', formData);
             setSummary(res.data.summary);
             setData(res.data.data);
-            fetchHistory();
+            addToHistory(res.data.summary);
 
             // Clear file input
             if (fileInputRef.current) {